@@ -4,7 +4,14 @@
 import codecs
 import io
 import os
-from typing import List
+
+# BOM records and canonical names of their codecs, none of BOMs is a
+# prefix of another one so the order does not matter
+_BOMS = (
+    (codecs.BOM_UTF8, codecs.lookup('utf-8').name),
+    (codecs.BOM_UTF16_BE, codecs.lookup('utf-16-be').name),
+    (codecs.BOM_UTF16_LE, codecs.lookup('utf-16-le').name),
+)
 
 
 def check_bom(file):
@@ -16,25 +23,29 @@ def check_bom(file):
     must be open in binary mode and positioned at offset 0.
     """
 
-    # try to read first three bytes
+    # try to read first three bytes, then back up to the end of BOM
     lead = file.read(3)
-    if len(lead) == 3 and lead == codecs.BOM_UTF8:
-        # UTF-8, position is already OK, use canonical name
-        return codecs.lookup('utf-8').name
-    elif len(lead) >= 2 and lead[:2] == codecs.BOM_UTF16_BE:
-        # need to backup one character
-        if len(lead) == 3:
-            file.seek(-1, os.SEEK_CUR)
-        return codecs.lookup('utf-16-be').name
-    elif len(lead) >= 2 and lead[:2] == codecs.BOM_UTF16_LE:
-        # need to backup one character
-        if len(lead) == 3:
-            file.seek(-1, os.SEEK_CUR)
-        return codecs.lookup('utf-16-le').name
-    else:
-        # no BOM, rewind
-        file.seek(-len(lead), os.SEEK_CUR)
-        return None
+    for bom, codec in _BOMS:
+        if lead.startswith(bom):
+            if len(lead) > len(bom):
+                file.seek(len(bom) - len(lead), os.SEEK_CUR)
+            return codec
+    # no BOM, rewind
+    file.seek(-len(lead), os.SEEK_CUR)
+    return None
+
+
+def advise_sequential(file):
+    """Tell operating system that file will be read mostly sequentially.
+
+    This is only a hint which can increase read-ahead, it does nothing on
+    platforms without ``posix_fadvise`` or for files without descriptor.
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except (OSError, io.UnsupportedOperation):
+            pass
 
 
 def guess_lineno(file):
@@ -78,23 +89,29 @@ class BinaryFileCR(io.BufferedReader):
     def readline(self, limit=-1):
         if limit == 0:
             return b""
-        data: List[bytes] = []
+        data = bytearray()
         while True:
-            byte = self.read(1)
-            if not byte:
-                return b"".join(data)
-            data.append(byte)
-            if limit >= 0 and len(data) >= limit:
-                return b"".join(data)
-            elif byte == self.LF:
-                return b"".join(data)
-            elif byte == self.CR:
-                # look at next byte
-                more_data = self.peek(1)
-                if not more_data:
-                    return b"".join(data)
-                nxt = more_data[:1]
-                if nxt == self.LF:
-                    nxt = self.read(1)
-                    data.append(nxt)
-                return b"".join(data)
+            # scan buffered data for terminators instead of reading it
+            # byte by byte
+            buf = self.peek(1)
+            if not buf:
+                break
+            if limit >= 0:
+                buf = buf[:limit - len(data)]
+            lf = buf.find(self.LF)
+            cr = buf.find(self.CR)
+            if lf < 0 and cr < 0:
+                data += self.read(len(buf))
+                if limit >= 0 and len(data) >= limit:
+                    break
+                continue
+            if cr < 0 or 0 <= lf < cr:
+                data += self.read(lf + 1)
+                break
+            data += self.read(cr + 1)
+            if limit < 0 or len(data) < limit:
+                # CR-LF is a single terminator
+                if self.peek(1)[:1] == self.LF:
+                    data += self.read(1)
+            break
+        return bytes(data)
@@ -9,12 +9,15 @@ __all__ = ['make_record', 'Record', 'Pointer', 'NameRec', 'Name',
            'Date', 'Individual']
 
 import enum
-from typing import Any, Iterator, List, Optional, Union
+from typing import Any, Iterator, List, Optional
 
 from .detail.name import (split_name, parse_name_altree, parse_name_ancestris,
                           parse_name_myher)
 from .date import DateValue
 
+# Sentinel for lazily-initialized attributes whose computed value can be None
+_UNSET: Any = object()
+
 
 @enum.unique
 class Dialect(enum.Enum):
@@ -308,11 +311,11 @@ class Pointer(Record):
     def __init__(self, parser):
         Record.__init__(self)
         self.parser = parser
-        self._value: Any = []  # use non-None to signify non-initialized
+        self._value: Any = _UNSET
 
     @property
     def ref(self):
-        if self._value == []:
+        if self._value is _UNSET:
             offset, _ = self.parser.xref0.get(self.value, (None, None))
             if offset is None:
                 self._value = None
@@ -345,6 +348,7 @@ class NameRec(Record):
 
     def __init__(self):
         Record.__init__(self)
+        self._type: Optional[str] = _UNSET
 
     def freeze(self):
         """Method called by parser when updates to this record finish.
@@ -375,8 +379,10 @@ class NameRec(Record):
         "maiden", "married" (or anything else).
         """
         # +1 TYPE <NAME_TYPE> {0:1}
-        rec = self.sub_tag("TYPE")
-        return rec.value if rec else None
+        if self._type is _UNSET:
+            rec = self.sub_tag("TYPE")
+            self._type = rec.value if rec else None
+        return self._type
 
     def __str__(self):
         return Record.__str__(self)
@@ -556,8 +562,8 @@ class Individual(Record):
     """
     def __init__(self):
         Record.__init__(self)
-        self._mother: Optional[Union[Record, List]] = []  # Non-None as uninitialized
-        self._father: Optional[Union[Record, List]] = []  # Non-None as uninitialized
+        self._mother: Optional[Record] = _UNSET
+        self._father: Optional[Record] = _UNSET
 
     @property
     def name(self):
@@ -578,14 +584,14 @@ class Individual(Record):
     @property
     def mother(self):
         """Parent of this individual (`Individual` or ``None``)"""
-        if self._mother == []:
+        if self._mother is _UNSET:
             self._mother = self.sub_tag("FAMC/WIFE")
         return self._mother
 
     @property
     def father(self):
         """Parent of this individual (`Individual` or ``None``)"""
-        if self._father == []:
+        if self._father is _UNSET:
             self._father = self.sub_tag("FAMC/HUSB")
         return self._father
 
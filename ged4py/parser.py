@@ -4,13 +4,19 @@
 __all__ = ['GedcomReader', 'ParserError', 'CodecError', 'IntegrityError',
            'guess_codec', 'GedcomLine']
 
+import bisect
 import codecs
+import collections
+import functools
 import io
 import logging
+import os
 import re
-from typing import List, NamedTuple, Optional
+import sys
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
-from .detail.io import check_bom, guess_lineno, BinaryFileCR
+from .detail.io import advise_sequential, check_bom, guess_lineno, BinaryFileCR
 from . import model
 
 _log = logging.getLogger(__name__)
@@ -19,12 +25,68 @@ _log = logging.getLogger(__name__)
 _re_GedcomLine = re.compile(br"""
         ^
         [ ]*(?P<level>\d+)                       # integer level number
-        (?:[ ]*(?P<xref>@[A-Z-a-z0-9][^@]*@))?    # optional @xref@
-        [ ]*(?P<tag>[A-Z-a-z0-9_]+)               # tag name
+        (?:[ ]*(?P<xref>@[A-Za-z0-9-][^@]*@))?    # optional @xref@
+        [ ]*(?P<tag>[A-Za-z0-9_-]+)               # tag name
         (?:[ ](?P<value>.*))?                    # optional value
         $
+""", re.X | re.ASCII)
+
+# set of ambiguous (and illegal) encodings and their corresponding codecs
+_AMBIGUOUS_ENCODINGS = {
+    'ibmpc': 'cp437',
+    "ibm": "cp437",
+    "ibm-pc": "cp437",
+    "oem": "cp437",
+    "msdos": "cp850",
+    "ibm dos": "cp850",
+    "ms-dos": "cp850",
+    "ansi": "cp1252",
+    "windows": "cp1252",
+    "ibm_windows": "cp1252",
+    "ibm windows": "cp1252",
+    "iso8859": "iso8859-1",
+    "latin1": "iso8859-1",
+    "macintosh": "mac-roman",
+}
+# set of all illegal encodings (unambiguous and ambiguous) and their codecs
+_ILLEGAL_ENCODINGS = {
+    "windows-1250": "cp1250",
+    "windows-1251": "cp1251",
+    "cp1252": "cp1252",
+    "iso-8859-1": "iso8859-1",
+    "iso8859-1": "iso8859-1",
+}
+_ILLEGAL_ENCODINGS.update(_AMBIGUOUS_ENCODINGS)
+# full set of encodings, including legal ones
+_GEDCOM_CHAR_TO_CODEC = {"ansel": "gedcom"}
+_GEDCOM_CHAR_TO_CODEC.update(_ILLEGAL_ENCODINGS)
+
+# Size of the first and the largest block read from a file when iterating
+# over lines. Block size grows between these limits so that reading of a
+# single short record does not need a large read, while long scans over the
+# whole file use large blocks.
+_MIN_BLOCK_SIZE = 512
+_MAX_BLOCK_SIZE = 1024 * 1024
+
+# finds lines with level number 0 in a block of lines, match starts at the
+# terminator of preceding line, matched group is a line without leading
+# whitespace
+_re_Level0Line = re.compile(br"""
+        [\r\n]                                   # end of preceding line
+        [ \t\x0b\x0c]*                            # whitespace, as bytes.lstrip()
+        (0+(?![0-9])[^\r\n]*)                     # line with level 0
 """, re.X)
 
+# bytes allowed in tag names, same set as in the character class of the
+# regex above
+_TAG_CHARS = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+
+# maps common level numbers to their values, faster than int()
+_LEVELS = {str(level).encode(): level for level in range(100)}
+
+# tags of continuation lines which are merged into the value of parent record
+_CONT_CONC = frozenset(("CONT", "CONC"))
+
 
 class GedcomLine(NamedTuple):
     """Class representing single line in a GEDCOM file.
@@ -51,8 +113,8 @@ class GedcomLine(NamedTuple):
     tag: str
     """Tag name (`str`)"""
 
-    value: bytes
-    """Record value (`bytes`)"""
+    value: Optional[bytes]
+    """Record value (`bytes` or ``None``)"""
 
     offset: int
     """Record offset in a file (`int`)"""
@@ -118,36 +180,6 @@ def guess_codec(file, errors="strict", require_char=False, warn=True):
         "strict" (default).
     """
 
-    # set of illegal but unambiguous encodings and their corresponding codecs
-    illegal_encodings = {
-        "windows-1250": "cp1250",
-        "windows-1251": "cp1251",
-        "cp1252": "cp1252",
-        "iso-8859-1": "iso8859-1",
-        "iso8859-1": "iso8859-1",
-    }
-    # set of ambiguous (and illegal) encodings
-    ambiguous_encodings = {
-        'ibmpc': 'cp437',
-        "ibm": "cp437",
-        "ibm-pc": "cp437",
-        "oem": "cp437",
-        "msdos": "cp850",
-        "ibm dos": "cp850",
-        "ms-dos": "cp850",
-        "ansi": "cp1252",
-        "windows": "cp1252",
-        "ibm_windows": "cp1252",
-        "ibm windows": "cp1252",
-        "iso8859": "iso8859-1",
-        "latin1": "iso8859-1",
-        "macintosh": "mac-roman",
-    }
-    illegal_encodings.update(ambiguous_encodings)
-    # full set of encodings, including legal ones
-    gedcom_char_to_codec = {"ansel": "gedcom"}
-    gedcom_char_to_codec.update(illegal_encodings)
-
     # check BOM first
     bom_codec = check_bom(file)
     bom_size = file.tell()
@@ -169,7 +201,7 @@ def guess_codec(file, errors="strict", require_char=False, warn=True):
         # of multi-byte characters). This implies that we can only
         # work with encodings that have ASCII as single-byte subset.
 
-        line = line.lstrip().rstrip(b"\r\n")
+        line = line.strip()
         words = line.split()
 
         if len(words) >= 2 and words[0] == b"0" and words[1] != b"HEAD":
@@ -181,15 +213,15 @@ def guess_codec(file, errors="strict", require_char=False, warn=True):
         elif len(words) >= 3 and words[0] == b"1" and words[1] == b"CHAR":
             try:
                 enc = b" ".join(words[2:]).decode(codec, errors)
-                encoding = gedcom_char_to_codec.get(enc.lower(), enc.lower())
-                if enc.lower() in illegal_encodings and warn:
+                encoding = _GEDCOM_CHAR_TO_CODEC.get(enc.lower(), enc.lower())
+                if enc.lower() in _ILLEGAL_ENCODINGS and warn:
                     _log.error("Line %d: \"%s\" - \"%s\" is not a legal "
                                "character set or encoding.", lineno, line, enc)
-                    if enc.lower() in ambiguous_encodings:
+                    if enc.lower() in _AMBIGUOUS_ENCODINGS:
                         _log.warning("Character set (\"%s\") is ambiguous, it "
                                      "will be interpreted as \"%s\"",
                                      enc, encoding)
-                new_codec = codecs.lookup(encoding).name
+                new_codec = _codec_name(encoding)
             except LookupError:
                 raise CodecError("Unknown codec name '{0}'".format(enc))
             if bom_codec is None:
@@ -202,6 +234,111 @@ def guess_codec(file, errors="strict", require_char=False, warn=True):
     return codec, bom_size
 
 
+# maps file identity and guess_codec() arguments to its result, in the
+# order of use, for files that are opened repeatedly
+_CODEC_CACHE_SIZE = 256
+_codec_cache: collections.OrderedDict = collections.OrderedDict()
+_codec_cache_lock = threading.Lock()
+
+
+def _guess_file_codec(path, file, errors, require_char, warn):
+    """Call `guess_codec` for a file opened by name, result is cached.
+
+    Cache key includes file path, device, inode, modification time and
+    size, so modified files are analyzed again. Messages generated by
+    `guess_codec` are only logged when file is analyzed. File is positioned
+    at offset 0 on entry, file position on return is not specified.
+    """
+    stat = os.fstat(file.fileno())
+    key = (path, stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size,
+           errors, require_char, warn)
+    with _codec_cache_lock:
+        result = _codec_cache.get(key)
+        if result is not None:
+            _codec_cache.move_to_end(key)
+            return result
+    # file is analyzed without holding the lock, concurrent calls for the
+    # same file may both analyze it, which is harmless
+    result = guess_codec(file, errors=errors, require_char=require_char,
+                         warn=warn)
+    with _codec_cache_lock:
+        _codec_cache[key] = result
+        if len(_codec_cache) > _CODEC_CACHE_SIZE:
+            _codec_cache.popitem(last=False)
+    return result
+
+
+# canonical names of codecs which are known to decode every ASCII byte
+# into the same character, including stateless handling of ESC/SO/SI;
+# stateful 7-bit codecs (e.g. ISO-2022) are deliberately not listed
+_ASCII_SUPERSET_CODECS = frozenset((
+    "gedcom", "ansel", "ascii", "utf-8",
+    "iso8859-1", "iso8859-2", "iso8859-3", "iso8859-4", "iso8859-5",
+    "iso8859-6", "iso8859-7", "iso8859-8", "iso8859-9", "iso8859-10",
+    "iso8859-13", "iso8859-14", "iso8859-15", "iso8859-16",
+    "cp1250", "cp1251", "cp1252", "cp1253", "cp1254", "cp1255",
+    "cp1256", "cp1257", "cp1258", "cp437", "cp850", "cp852", "cp866",
+    "koi8-r", "koi8-u", "mac-roman",
+))
+
+
+if hasattr(bytes, "isascii"):
+    _is_ascii = bytes.isascii
+else:
+    # Python 3.6 has no bytes.isascii()
+    _re_NonAscii = re.compile(br"[\x80-\xff]")
+
+    def _is_ascii(data):
+        return _re_NonAscii.search(data) is None
+
+
+@functools.lru_cache(maxsize=32)
+def _ascii_compatible(encoding):
+    """Return True if codec decodes ASCII bytes into the same characters
+    as ASCII codec does.
+
+    Such codecs can be bypassed for ASCII-only data, which is much faster
+    for codecs implemented in Python (e.g. ANSEL). Decoding ASCII range
+    cannot prove that a codec has no state (ISO-2022 codecs use ASCII
+    escape sequences), so only an explicit list of codecs is trusted.
+    """
+    try:
+        return codecs.lookup(encoding).name in _ASCII_SUPERSET_CODECS
+    except LookupError:
+        return False
+
+
+# canonical names of codecs that bytes.decode() implements directly
+_BUILTIN_DECODE_CODECS = frozenset(
+    codecs.lookup(name).name for name in ("utf-8", "ascii", "latin-1", "utf-16", "utf-32")
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _codec_decode(encoding):
+    """Return codec decode function, or None if `bytes.decode` is faster.
+
+    `bytes.decode` looks up codec by its name on every call, except for a
+    few built-in codecs, calling codec decode function directly avoids that
+    lookup. None is also returned for unknown codecs.
+    """
+    try:
+        codec_info = codecs.lookup(encoding)
+    except LookupError:
+        return None
+    if codec_info.name in _BUILTIN_DECODE_CODECS:
+        return None
+    return codec_info.decode
+
+
+@functools.lru_cache(maxsize=32)
+def _codec_name(encoding):
+    """Return canonical name of a codec, raises `LookupError` for unknown
+    codecs.
+    """
+    return codecs.lookup(encoding).name
+
+
 class GedcomReader:
     """Main interface for reading GEDCOM files.
 
@@ -220,6 +357,9 @@ class GedcomReader:
         If True then exception is thrown if CHAR record is not found in a
         header, if False and CHAR is not in the header then codec determined
         from BOM or "gedcom" is used.
+    record_cache_size : `int`, optional
+        Maximum number of records kept in a cache by `read_record()`, most
+        recently used records are kept. Zero disables caching.
 
     Notes
     -----
@@ -239,40 +379,64 @@ class GedcomReader:
     """
 
     def __init__(self, file, encoding=None, errors="strict",
-                 require_char=False):
+                 require_char=False, record_cache_size=1024):
         self._encoding = encoding
         self._errors = errors
         self._bom_size = 0
         self._index0 = None   # list of level=0 record positions
         self._xref0 = None    # maps xref_id to level=0 record position
+        self._tag0 = None     # maps tag to list of level=0 record positions
         self._header = None
-        self._dialect = None
+        self._header_read = False  # True after first attempt to read header
+        self._dialect: Optional[model.Dialect] = None
+        self._tag_cache: Dict[bytes, str] = {}  # maps tag bytes to tag names
+        self._decoder_factory = None  # incremental decoder class for encoding
+        # maps offset to record, in the order of use
+        self._record_cache: collections.OrderedDict = collections.OrderedDict()
+        self._record_cache_size = record_cache_size
 
         # open the file
+        path = None
         if hasattr(file, 'read'):
             # assume it is a file already
             if hasattr(file, 'seekable'):
                 # check that it supports seek()
                 if not file.seekable():
                     raise IOError("Input file does not support seek.")
-            self._file = file
         else:
-            raw = io.FileIO(file)
-            self._file = io.BufferedReader(raw)
-        self._file = BinaryFileCR(self._file)
+            # BinaryFileCR is a buffered reader, no need for another
+            # buffering layer. Default buffer size is deliberate, large
+            # sequential reads are done in blocks by _iter_lines() and
+            # bypass the buffer, while reading of a single record after
+            # seek() would refill a large buffer completely.
+            file = io.FileIO(file)
+            # index and records0() read whole file from start to end
+            advise_sequential(file)
+            if not isinstance(file.name, int):
+                # file descriptors are reused, do not cache their codecs
+                path = os.path.abspath(file.name)
+        if not isinstance(file, BinaryFileCR):
+            file = BinaryFileCR(file)
+        self._file = file
 
         # check codec and BOM
         try:
-            encoding, self._bom_size = guess_codec(self._file,
-                                                   errors=self._errors,
-                                                   require_char=require_char,
-                                                   warn=self._encoding is None)
+            if path is None:
+                encoding, self._bom_size = guess_codec(
+                    self._file, errors=self._errors, require_char=require_char,
+                    warn=self._encoding is None)
+            else:
+                encoding, self._bom_size = _guess_file_codec(
+                    path, self._file, errors=self._errors,
+                    require_char=require_char, warn=self._encoding is None)
         except Exception:
             self._file.close()
             raise
         self._file.seek(self._bom_size)
         if not self._encoding:
             self._encoding = encoding
+        self._ascii_compatible = _ascii_compatible(self._encoding)
+        self._codec_decode = _codec_decode(self._encoding)
 
     @property
     def index0(self):
@@ -295,26 +459,117 @@ class GedcomReader:
     def header(self):
         """Header record (`ged4py.model.Record`).
         """
-        if self._index0 is None:
-            self._init_index()
+        if not self._header_read:
+            self._init_header()
         return self._header
 
-    def _init_index(self):
-        _log.debug("in _init_index")
-        self._index0 = []
-        self._xref0 = {}
-        # scan whole file for level=0 records
+    def _init_header(self):
+        # Header records are always read with default dialect, flag is set
+        # before reading to avoid infinite recursion via `dialect` property.
+        self._header_read = True
+        # only need to scan up to the first level=0 record
         for gline in self.GedcomLines(self._bom_size):
-            _log.debug("  _init_index gline: %s", gline)
             if gline.level == 0:
-                self._index0.append((gline.offset, gline.tag))
-                if gline.xref_id:
-                    self._xref0[gline.xref_id] = (gline.offset, gline.tag)
-            _log.debug("  _init_index gline: done proc")
-        if self._index0 and self._index0[0][1] == 'HEAD':
-            self._header = self.read_record(self._index0[0][0])
+                if gline.tag == "HEAD":
+                    self._header = self.read_record(gline.offset)
+                break
+
+    def _init_index(self):
+        _log.debug("in _init_index")
+        for _ in self._scan_index():
+            pass
         _log.debug("_init_index done")
 
+    def _scan_index(self):
+        """Generator which scans whole file for level=0 records and builds
+        index.
+
+        Index attributes are only set after the whole file is scanned.
+
+        Yields
+        ------
+        offset : `int`
+            Position of the level=0 record in the file.
+        tag : `str`
+            Tag of the level=0 record.
+        """
+        index0: List[Tuple[int, str]] = []
+        xref0: Dict[str, Tuple[int, str]] = {}
+        tag0: Dict[str, List[int]] = {}
+        tag_cache = self._tag_cache
+        encoding, errors = self._encoding, self._errors
+        ascii_compatible, is_ascii = self._ascii_compatible, _is_ascii
+        re_match = _re_GedcomLine.match
+        index0_append = index0.append
+        # scan whole file for level=0 records, only these lines are parsed,
+        # syntax of other lines is checked when records are read
+        for offset, line in self._iter_level0_lines(self._bom_size):
+            match = re_match(line)
+            if not match:
+                raise self._line_error(ParserError, "Invalid syntax", offset, line)
+            _, xref_id_bytes, tag_bytes, _ = match.groups()
+            tag = tag_cache.get(tag_bytes)
+            if tag is None:
+                tag = sys.intern(tag_bytes.decode(encoding, errors))
+                tag_cache[tag_bytes] = tag
+            index0_append((offset, tag))
+            tag0.setdefault(tag, []).append(offset)
+            if xref_id_bytes:
+                if ascii_compatible and is_ascii(xref_id_bytes):
+                    xref_id = xref_id_bytes.decode("ascii")
+                else:
+                    xref_id = xref_id_bytes.decode(encoding, errors)
+                xref0[xref_id] = (offset, tag)
+            yield offset, tag
+        self._index0, self._xref0, self._tag0 = index0, xref0, tag0
+
+    def _iter_level0_lines(self, offset):
+        """Generator for lines with level number 0 and their positions.
+
+        Parameters
+        ----------
+        offset : `int`
+            Position in the file to start reading, must be at the beginning
+            of a line.
+
+        Yields
+        ------
+        offset : `int`
+            Position of the line in the file.
+        line : `bytes`
+            Line contents without leading whitespace and line terminator.
+
+        Notes
+        -----
+        This is a faster alternative to filtering `_iter_lines` output, each
+        block of data is searched for level 0 lines with a regular
+        expression, other lines are never split or copied.
+        """
+        file = self._file
+        pos = offset
+        # buffer always starts with a terminator of the preceding line, add
+        # one for the first line
+        tail = b"\n"
+        offset -= 1
+        while True:
+            file.seek(pos)
+            block = file.read(_MAX_BLOCK_SIZE)
+            pos += len(block)
+            buf = tail + block
+            if block:
+                # only look at complete lines, CR at the end could be
+                # followed by LF but that does not matter for this search
+                end = max(buf.rfind(b"\n"), buf.rfind(b"\r"))
+            else:
+                # last line without terminator
+                end = len(buf)
+            for match in _re_Level0Line.finditer(buf, 0, end):
+                yield offset + match.start() + 1, match.group(1)
+            if not block:
+                return
+            tail = buf[end:]
+            offset += end
+
     @property
     def dialect(self):
         """File dialect as one of `ged4py.model.Dialect` enums.
@@ -335,6 +590,56 @@ class GedcomReader:
     @dialect.setter
     def dialect(self, value):
         self._dialect = value
+        # cached records were made with previous dialect
+        self._record_cache.clear()
+
+    def _iter_lines(self, offset):
+        """Generator for lines in a file and their positions.
+
+        Parameters
+        ----------
+        offset : `int`
+            Position in the file to start reading.
+
+        Yields
+        ------
+        offset : `int`
+            Position of the line in the file.
+        line : `bytes`
+            Line contents without line terminator.
+
+        Notes
+        -----
+        File is read in blocks which are split into lines in memory, this is
+        much faster than reading it line by line. Line terminators can be LF,
+        CR-LF, or CR. File is re-positioned before every read so that
+        multiple generators can be used simultaneously.
+        """
+        file = self._file
+        pos = offset
+        block_size = _MIN_BLOCK_SIZE
+        tail = b""
+        while True:
+            file.seek(pos)
+            block = file.read(block_size)
+            if not block:
+                # last line without terminator
+                if tail:
+                    yield offset, tail.rstrip(b"\r\n")
+                return
+            pos += len(block)
+            block_size = min(block_size * 2, _MAX_BLOCK_SIZE)
+
+            lines = (tail + block).splitlines(True)
+            # last line may be incomplete, or it can end with CR which
+            # could be followed by LF in the next block
+            tail = lines.pop()
+            if tail[-1:] == b"\n":
+                lines.append(tail)
+                tail = b""
+            for line in lines:
+                yield offset, line.rstrip(b"\r\n")
+                offset += len(line)
 
     def GedcomLines(self, offset):
         """Generator method for *gedcom lines*.
@@ -367,67 +672,138 @@ class GedcomReader:
         line into `GedcomLine` class. It is an implementation detail used by
         other methods, most clients will not need to use this method.
         """
+        for fields in self._parse_lines(offset):
+            yield GedcomLine._make(fields)
 
-        self._file.seek(offset)
+    def _parse_lines(self, offset):
+        """Generator for parsed lines, see `GedcomLines()`.
 
-        prev_gline: Optional[GedcomLine] = None
-        while True:
+        Parameters
+        ----------
+        offset : `int`
+            Position in the file to start reading.
 
-            offset = self._file.tell()
-            line = self._file.readline()  # stops at \n
-            if not line:
-                break
-            line = line.lstrip().rstrip(b"\r\n")
+        Yields
+        ------
+        fields : `tuple`
+            Tuple of (level, xref_id, tag, value, offset), same as attributes
+            of `GedcomLine`. Reading records does not need separate objects
+            for lines, tuples are much faster to make.
+
+        Raises
+        ------
+        ParserError
+            Raised if lines have incorrect syntax.
+        """
+
+        # local aliases for things used on every line
+        tag_cache = self._tag_cache
+        encoding, errors = self._encoding, self._errors
+        ascii_compatible, is_ascii = self._ascii_compatible, _is_ascii
+        re_match = _re_GedcomLine.match
+        # level and CONT/CONC flag of preceding line, -1 for first line
+        prev_level = -1
+        prev_cont = False
+        for offset, line in self._iter_lines(offset):
+
+            line = line.lstrip()
+
+            # Fast path for the common case of single-space separated
+            # fields, anything unusual is handed to the regular expression
+            # which implements the complete grammar.
+            parts = line.split(b" ", 2)
+            nparts = len(parts)
+            tag_bytes = None
+            level = _LEVELS.get(parts[0], -1)
+            if level < 0 and parts[0].isdigit():
+                level = int(parts[0])
+            if nparts > 1 and level >= 0:
+                xref_id_bytes = parts[1]
+                if xref_id_bytes[:1] == b"@":
+                    if (nparts == 3 and len(xref_id_bytes) > 2 and
+                            xref_id_bytes[-1:] == b"@" and
+                            xref_id_bytes.count(b"@") == 2 and
+                            (xref_id_bytes[1:2].isalnum() or
+                             xref_id_bytes[1:2] == b"-")):
+                        tag_bytes, sep, value = parts[2].partition(b" ")
+                        if not sep:
+                            value = None
+                else:
+                    tag_bytes = xref_id_bytes
+                    xref_id_bytes = None
+                    value = parts[2] if nparts == 3 else None
+                # only validate tags that were not seen yet, cache only
+                # contains valid names
+                if (tag_bytes is not None and tag_bytes not in tag_cache and
+                        (not tag_bytes or tag_bytes.strip(_TAG_CHARS))):
+                    tag_bytes = None
+            if tag_bytes is None:
+                match = re_match(line)
+                if not match:
+                    raise self._line_error(ParserError, "Invalid syntax", offset, line)
+                level_bytes, xref_id_bytes, tag_bytes, value = match.groups()
+                level = int(level_bytes)
 
-            match = _re_GedcomLine.match(line)
-            if not match:
-                self._file.seek(offset)
-                lineno = guess_lineno(self._file)
-                line = line.decode(self._encoding, "ignore")
-                raise ParserError("Invalid syntax at line "
-                                  "{0}: `{1}'".format(lineno, line))
-
-            level = int(match.group('level'))
-            xref_id_bytes = match.group('xref')
             xref_id: Optional[str]
             if xref_id_bytes:
-                xref_id = xref_id_bytes.decode(self._encoding, self._errors)
+                if ascii_compatible and is_ascii(xref_id_bytes):
+                    xref_id = xref_id_bytes.decode("ascii")
+                else:
+                    xref_id = xref_id_bytes.decode(encoding, errors)
             else:
                 xref_id = None
-            tag = match.group('tag').decode(self._encoding, self._errors)
+            # set of tags is small, cache decoded names, interned names
+            # compare faster with tag literals used elsewhere
+            tag = tag_cache.get(tag_bytes)
+            if tag is None:
+                tag = sys.intern(tag_bytes.decode(encoding, errors))
+                tag_cache[tag_bytes] = tag
 
             # simple structural integrity check
-            if prev_gline is not None:
-                if level - prev_gline.level > 1:
+            cont = tag in _CONT_CONC
+            if prev_level >= 0:
+                if level - prev_level > 1:
                     # nested levels should be incremental (+1)
-                    self._file.seek(offset)
-                    lineno = guess_lineno(self._file)
-                    line = line.decode(self._encoding, "ignore")
-                    raise IntegrityError("Structural integrity - "
-                                         "illegal level nesting at line "
-                                         "{0}: `{1}'".format(lineno, line))
-                if tag in ("CONT", "CONC"):
+                    raise self._line_error(IntegrityError, "Structural integrity - "
+                                           "illegal level nesting", offset, line)
+                if cont:
                     # CONT/CONC level must be +1 from preceding non-CONT/CONC
                     # record or the same as preceding CONT/CONC record
-                    if ((prev_gline.tag in ("CONT", "CONC") and
-                         level != prev_gline.level) or
-                        (prev_gline.tag not in ("CONT", "CONC") and
-                         level - prev_gline.level != 1)):
-                        self._file.seek(offset)
-                        lineno = guess_lineno(self._file)
-                        line = line.decode(self._encoding, "ignore")
-                        raise IntegrityError("Structural integrity -  illegal "
-                                             "CONC/CONT nesting at line "
-                                             "{0}: `{1}'".format(lineno, line))
-
-            gline = GedcomLine(level=level,
-                               xref_id=xref_id,
-                               tag=tag,
-                               value=match.group('value'),
-                               offset=offset)
-            yield gline
-
-            prev_gline = gline
+                    if ((prev_cont and level != prev_level) or
+                            (not prev_cont and level - prev_level != 1)):
+                        raise self._line_error(IntegrityError, "Structural integrity - "
+                                               "illegal CONC/CONT nesting", offset, line)
+
+            yield level, xref_id, tag, value, offset
+
+            prev_level = level
+            prev_cont = cont
+
+    def _line_error(self, exc_class, message, offset, line):
+        """Make an exception for a bad line, with its line number.
+
+        Parameters
+        ----------
+        exc_class : `type`
+            Exception class.
+        message : `str`
+            Error message, line number and line contents are appended to it.
+        offset : `int`
+            Position of the line in the file.
+        line : `bytes`
+            Line contents.
+
+        Returns
+        -------
+        exception : `Exception`
+            Instance of ``exc_class``.
+        """
+        # line number is only needed here, it is too expensive to track it
+        # for every line
+        self._file.seek(offset)
+        lineno = guess_lineno(self._file)
+        line = line.decode(self._encoding, "ignore")
+        return exc_class("{0} at line {1}: `{2}'".format(message, lineno, line))
 
     def records0(self, tag=None):
         """Iterator over level=0 records with given tag.
@@ -447,11 +823,41 @@ class GedcomReader:
         record : `~ged4py.model.Record`
             Instances of `~ged4py.model.Record` or its subclasses.
         """
-        _log.debug("in records0")
-        for offset, xtag in self.index0:
-            _log.debug("    records0: offset: %s; xtag: %s", offset, xtag)
-            if tag is None or tag == xtag:
+        _log.debug("in records0(%s)", tag)
+        if tag is None:
+            # all records are read in a single pass over the file, starting
+            # at first level-0 line
+            first = next(self._iter_level0_lines(self._bom_size), None)
+            if first is not None:
+                yield from self._read_records(first[0])
+        elif self._tag0 is None:
+            yield from self._scan_records0(tag)
+        else:
+            for offset in self._tag0.get(tag, []):
+                yield self.read_record(offset)
+
+    def _scan_records0(self, tag):
+        """Generator for level=0 records with given tag, used before index
+        is built.
+
+        File is scanned for matching records instead of building index
+        first, so that first records are returned without reading whole
+        file, index is built when scan finishes.
+        """
+        scan = self._scan_index()
+        for offset, rec_tag in scan:
+            if rec_tag == tag:
                 yield self.read_record(offset)
+                if self._tag0 is not None:
+                    # index was built while caller used the record (e.g.
+                    # to resolve pointers), continue with index instead
+                    # of scanning rest of the file again
+                    scan.close()
+                    offsets = self._tag0.get(tag, [])
+                    start = bisect.bisect_right(offsets, offset)
+                    for next_offset in offsets[start:]:
+                        yield self.read_record(next_offset)
+                    return
 
     def read_record(self, offset):
         """Read next complete record from a file starting at given position.
@@ -478,57 +884,147 @@ class GedcomReader:
         ParserError
             Raised if `offsets` does not point to the beginning of a record or
             for any parsing errors.
+
+        Notes
+        -----
+        Recently read records are cached, reading the same offset again
+        returns the same record instance. Records should be treated as
+        read-only by clients.
+        """
+        cache = self._record_cache
+        rec = cache.get(offset)
+        if rec is not None:
+            cache.move_to_end(offset)
+            return rec
+        rec = self._read_record(offset)
+        if rec is not None and self._record_cache_size > 0:
+            cache[offset] = rec
+            if len(cache) > self._record_cache_size:
+                cache.popitem(last=False)
+        return rec
+
+    def _read_record(self, offset):
+        """Read a record from a file bypassing the cache, see `read_record()`.
+        """
+        records = self._read_records(offset)
+        try:
+            return next(records, None)
+        finally:
+            records.close()
+
+    def _read_records(self, offset):
+        """Generator for consecutive records starting at given position.
+
+        Parameters
+        ----------
+        offset : `int`
+            Position in the file to start reading.
+
+        Yields
+        ------
+        record : `~ged4py.model.Record`
+            Records with the same level as the record at ``offset``, stops
+            at EOF or at a record with higher (smaller) level number.
+
+        Notes
+        -----
+        Each record is yielded after the first line of the following record
+        is read, this makes it possible to read many records in a single
+        pass over the file instead of re-reading file for every record.
         """
-        _log.debug("in read_record(%s)", offset)
         stack: List[Optional[model.Record]] = []  # stores per-level current records
         reclevel: Optional[int] = None
-        for gline in self.GedcomLines(offset):
-            _log.debug("    read_record, gline: %s", gline)
-            level = gline.level
-
-            if reclevel is None:
-                # this is the first record, remember its level
+        records: List[model.Record] = []  # all records made, in file order
+        make_record = self._make_record
+        for fields in self._parse_lines(offset):
+            level = fields[0]
+
+            if reclevel is None or level == reclevel:
+                if records:
+                    # previous record is complete
+                    yield self._finalize_records(records)
+                    records = []
+                # this is the first line of a record, remember its level
                 reclevel = level
-            elif level <= reclevel:
-                # stop at the record of the same or higher (smaller) level
+                # dialect is the same for a record and its sub-records,
+                # header records use default dialect, this also avoids
+                # infinite cycle
+                if level == 0 and fields[2] == "HEAD":
+                    dialect = model.Dialect.DEFAULT
+                else:
+                    dialect = self._dialect or self.dialect
+                # placeholders for parent levels
+                stack = [None] * level
+            elif level < reclevel:
+                # stop at the record of higher (smaller) level
                 break
 
-            # All previously seen records at this level and below can
-            # be finalized now
-            for rec in reversed(stack[level:]):
-                # decode bytes value into string
-                if rec:
-                    if rec.value is not None:
-                        rec.value = rec.value.decode(self._encoding,
-                                                     self._errors)
-                    rec.freeze()
-#                    _log.debug("    read_record, rec: %s", rec)
-            del stack[level + 1:]
-
-            # extend stack to fit this level (and make parent levels if needed)
-            stack.extend([None] * (level + 1 - len(stack)))
-
             # make Record out of it (it can be updated later)
             parent = stack[level - 1] if level > 0 else None
-            rec = self._make_record(parent, gline)
+            rec = make_record(parent, fields, dialect)
+            if rec is not None:
+                records.append(rec)
+
+            # store as current record at this level, GedcomLines()
+            # guarantees that levels grow at most by one, so entries for
+            # deeper levels are never used before they are replaced
+            if level < len(stack):
+                stack[level] = rec
+            else:
+                stack.append(rec)
 
-            # store as current record at this level
-            stack[level] = rec
+        if records:
+            yield self._finalize_records(records)
 
-        for rec in reversed(stack[reclevel:]):
-            if rec:
-                if rec.value is not None:
-                    rec.value = rec.value.decode(self._encoding, self._errors)
-                rec.freeze()
-                _log.debug("    read_record, rec: %s", rec)
+    def _finalize_records(self, records):
+        """Finalize all records made for a single top record.
 
-        if stack:
-            assert reclevel is not None
-            return stack[reclevel]
-        else:
-            return None
+        Parameters
+        ----------
+        records : `list` [ `~ged4py.model.Record` ]
+            Top record followed by all its sub-records, in file order.
 
-    def _make_record(self, parent, gline):
+        Returns
+        -------
+        record : `~ged4py.model.Record`
+            Finalized top record.
+        """
+        encoding, errors = self._encoding, self._errors
+        ascii_compatible, is_ascii = self._ascii_compatible, _is_ascii
+        codec_decode = self._codec_decode
+        # Reversed order guarantees that sub-records are finalized before
+        # their parents.
+        for rec in reversed(records):
+            # decode bytes value into string, ASCII-only values (the most
+            # common case) do not need a possibly slow codec
+            value = rec.value
+            if isinstance(value, list):
+                # CONT/CONC pieces are decoded one by one instead of making
+                # a joined bytes copy
+                if ascii_compatible and all(is_ascii(piece) for piece in value):
+                    rec.value = "".join([piece.decode("ascii") for piece in value])
+                else:
+                    # incremental decoder takes care of multi-byte
+                    # characters split between pieces
+                    decoder_factory = self._decoder_factory
+                    if decoder_factory is None:
+                        decoder_factory = codecs.getincrementaldecoder(encoding)
+                        self._decoder_factory = decoder_factory
+                    decode = decoder_factory(errors).decode
+                    pieces = [decode(piece) for piece in value]
+                    pieces.append(decode(b"", True))
+                    rec.value = "".join(pieces)
+            elif value is not None:
+                if ascii_compatible and is_ascii(value):
+                    rec.value = value.decode("ascii")
+                elif codec_decode is None:
+                    rec.value = value.decode(encoding, errors)
+                else:
+                    rec.value = codec_decode(value, errors)[0]
+            rec.freeze()
+        return records[0]
+
+    def _make_record(self, parent, fields, dialect):
         """Process next record.
 
         This method created new record from the line read from file if
@@ -537,41 +1033,46 @@ class GedcomReader:
         entirely and None is returned. Otherwise if new record tag is ``CONT``
         or ``CONC`` its value is added to parent value. For all other tags
         new record is made and it is added to parent sub_records attribute.
+        While parent record is being updated its value is a list of `bytes`
+        pieces, `read_record()` joins them when the record is finalized.
 
         Parameters
         ----------
         parent : `ged4py.model.Record`
             Parent record of the new record
-        gline : `GedcomLine`
-            Current parsed line
+        fields : `tuple`
+            Current parsed line, tuple of (level, xref_id, tag, value,
+            offset) as produced by `_parse_lines()`.
+        dialect : `ged4py.model.Dialect`
+            Dialect for the new record, resolved once by `read_record()`.
 
         Returns
         -------
         record : `ged4py.model.Record` or None
         """
 
-        if parent and gline.tag in ("CONT", "CONC"):
+        level, xref_id, tag, value, offset = fields
+        if parent is not None and tag in _CONT_CONC:
             # concatenate, only for non-BLOBs
             if parent.tag != "BLOB":
                 # have to be careful concatenating empty/None values
-                value = gline.value
-                if gline.tag == "CONT":
+                if tag == "CONT":
                     value = b"\n" + (value or b"")
                 if value is not None:
-                    parent.value = (parent.value or b"") + value
+                    # collect pieces in a list, read_record() joins them
+                    # when record is finalized
+                    if isinstance(parent.value, list):
+                        parent.value.append(value)
+                    else:
+                        parent.value = [parent.value or b"", value]
             return None
 
-        # avoid infinite cycle
-        dialect = model.Dialect.DEFAULT
-        if not (gline.level == 0 and gline.tag == "HEAD") and self._header:
-            dialect = self.dialect
-        rec = model.make_record(level=gline.level, xref_id=gline.xref_id,
-                                tag=gline.tag, value=gline.value,
-                                sub_records=[], offset=gline.offset,
+        rec = model.make_record(level=level, xref_id=xref_id, tag=tag,
+                                value=value, sub_records=[], offset=offset,
                                 dialect=dialect, parser=self)
 
         # add to parent's sub-records list
-        if parent:
+        if parent is not None:
             parent.sub_records.append(rec)
 
         return rec
@@ -580,4 +1081,5 @@ class GedcomReader:
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
+        self._record_cache.clear()
         self._file.close()
@@ -166,58 +166,60 @@ class TestDetailDate(unittest.TestCase):
     def test_002_cal_date_key(self):
         """Test date.CalendarDate class."""
 
-        date = GregorianDate(2017, "OCT", 9)
-        self.assertEqual(date.key(), (2458035.5, 0))
-
-        date = GregorianDate(1699, "FEB", 1, dual_year=1700)
-        self.assertEqual(date.key(), (2342003.5, 0))
-
-        date = FrenchDate(2017, "VENT", bc=True)
-        self.assertEqual(date.key(), (1638959.5, 1))
-
-        date = HebrewDate(2017, "TSH", 22)
-        self.assertEqual(date.key(), (1084542.5, 0))
-
-        date = JulianDate(1000)
-        self.assertEqual(date.key(), (2086672.5, 1))
+        # compare all keys at once, failure shows every mismatch
+        dates = [
+            GregorianDate(2017, "OCT", 9),
+            GregorianDate(1699, "FEB", 1, dual_year=1700),
+            FrenchDate(2017, "VENT", bc=True),
+            HebrewDate(2017, "TSH", 22),
+            JulianDate(1000),
+        ]
+        expected = [
+            (2458035.5, 0),
+            (2342003.5, 0),
+            (1638959.5, 1),
+            (1084542.5, 0),
+            (2086672.5, 1),
+        ]
+        self.assertEqual([date.key() for date in dates], expected)
 
     def test_003_cal_date_cmp(self):
         """Test date.CalendarDate class."""
 
-        self.assertTrue(GregorianDate(2016, "JAN", 1) < GregorianDate(2017, "JAN", 1))
-        self.assertTrue(GregorianDate(2017, "JAN", 1) < GregorianDate(2017, "FEB", 1))
-        self.assertTrue(GregorianDate(2017, "JAN", 1) < GregorianDate(2017, "JAN", 2))
+        self.assertLess(GregorianDate(2016, "JAN", 1), GregorianDate(2017, "JAN", 1))
+        self.assertLess(GregorianDate(2017, "JAN", 1), GregorianDate(2017, "FEB", 1))
+        self.assertLess(GregorianDate(2017, "JAN", 1), GregorianDate(2017, "JAN", 2))
 
-        self.assertTrue(GregorianDate(2017, "JAN", 1) <= GregorianDate(2017, "JAN", 2))
-        self.assertTrue(GregorianDate(2017, "JAN", 2) > GregorianDate(2017, "JAN", 1))
-        self.assertTrue(GregorianDate(2017, "JAN", 2) >= GregorianDate(2017, "JAN", 1))
-        self.assertTrue(GregorianDate(2017, "JAN", 1) == GregorianDate(2017, "JAN", 1))
-        self.assertTrue(GregorianDate(2017, "JAN", 1) != GregorianDate(2017, "JAN", 2))
+        self.assertLessEqual(GregorianDate(2017, "JAN", 1), GregorianDate(2017, "JAN", 2))
+        self.assertGreater(GregorianDate(2017, "JAN", 2), GregorianDate(2017, "JAN", 1))
+        self.assertGreaterEqual(GregorianDate(2017, "JAN", 2), GregorianDate(2017, "JAN", 1))
+        self.assertEqual(GregorianDate(2017, "JAN", 1), GregorianDate(2017, "JAN", 1))
+        self.assertNotEqual(GregorianDate(2017, "JAN", 1), GregorianDate(2017, "JAN", 2))
 
         # missing day compares as "past" the last day of month, but before next month
-        self.assertTrue(GregorianDate(2017, "JAN") > GregorianDate(2017, "JAN", 31))
-        self.assertTrue(GregorianDate(2017, "JAN") < GregorianDate(2017, "FEB", 1))
+        self.assertGreater(GregorianDate(2017, "JAN"), GregorianDate(2017, "JAN", 31))
+        self.assertLess(GregorianDate(2017, "JAN"), GregorianDate(2017, "FEB", 1))
         # missing month compares as "past" the last day of year, but before next year
-        self.assertTrue(GregorianDate(2017) > GregorianDate(2017, "DEC", 31))
-        self.assertTrue(GregorianDate(2017) < GregorianDate(2018, "JAN", 1))
+        self.assertGreater(GregorianDate(2017), GregorianDate(2017, "DEC", 31))
+        self.assertLess(GregorianDate(2017), GregorianDate(2018, "JAN", 1))
 
         # dual date
-        self.assertTrue(GregorianDate(1700, "JAN", 1) == GregorianDate(1699, "JAN", 1, dual_year=1700))
+        self.assertEqual(GregorianDate(1700, "JAN", 1), GregorianDate(1699, "JAN", 1, dual_year=1700))
 
         # compare Gregorian and Julian dates
-        self.assertTrue(GregorianDate(1582, "OCT", 15) == JulianDate(1582, "OCT", 5))
-        self.assertTrue(GregorianDate(1582, "OCT", 16) > JulianDate(1582, "OCT", 5))
-        self.assertTrue(JulianDate(1582, "OCT", 6) > GregorianDate(1582, "OCT", 15))
-        self.assertTrue(GregorianDate(2000, "JAN", 14) == JulianDate(2000, "JAN", 1))
+        self.assertEqual(GregorianDate(1582, "OCT", 15), JulianDate(1582, "OCT", 5))
+        self.assertGreater(GregorianDate(1582, "OCT", 16), JulianDate(1582, "OCT", 5))
+        self.assertGreater(JulianDate(1582, "OCT", 6), GregorianDate(1582, "OCT", 15))
+        self.assertEqual(GregorianDate(2000, "JAN", 14), JulianDate(2000, "JAN", 1))
 
         # compare Gregorian and French dates
-        self.assertTrue(GregorianDate(1792, "SEP", 22) == FrenchDate(1, "VEND", 1))
-        self.assertTrue(GregorianDate(1792, "SEP", 23) > FrenchDate(1, "VEND", 1))
-        self.assertTrue(FrenchDate(1, "VEND", 2) > GregorianDate(1792, "SEP", 22))
-        self.assertTrue(GregorianDate(2020, "SEP", 21) == FrenchDate(228, "COMP", 5))
+        self.assertEqual(GregorianDate(1792, "SEP", 22), FrenchDate(1, "VEND", 1))
+        self.assertGreater(GregorianDate(1792, "SEP", 23), FrenchDate(1, "VEND", 1))
+        self.assertGreater(FrenchDate(1, "VEND", 2), GregorianDate(1792, "SEP", 22))
+        self.assertEqual(GregorianDate(2020, "SEP", 21), FrenchDate(228, "COMP", 5))
 
         # compare Gregorian and Hebrew dates
-        self.assertTrue(GregorianDate(2020, "JAN", 1) == HebrewDate(5780, "SVN", 4))
+        self.assertEqual(GregorianDate(2020, "JAN", 1), HebrewDate(5780, "SVN", 4))
 
     def test_004_cal_date_str(self):
         """Test date.CalendarDate class."""
@@ -301,21 +303,20 @@ class TestDetailDate(unittest.TestCase):
         self.assertEqual(date.original, "@#DHEBREW@ 7 NSN 5000")
         self.assertEqual(date.calendar, CalendarType.HEBREW)
 
-        # cannot handle ROMAN
-        with self.assertRaises(ValueError):
-            date = CalendarDate.parse("@#DROMAN@ 2020")
-
-        # cannot handle UNKNOWN
-        with self.assertRaises(ValueError):
-            date = CalendarDate.parse("@#DUNKNOWN@ 2020")
-
-        # dual year only works for GREGORIAN
-        with self.assertRaises(ValueError):
-            date = CalendarDate.parse("@#DJULIAN@ 2020/21")
-
-        # cannot parse nonsense
-        with self.assertRaises(ValueError):
-            date = CalendarDate.parse("start of time")
+        bad_dates = [
+            # cannot handle ROMAN
+            "@#DROMAN@ 2020",
+            # cannot handle UNKNOWN
+            "@#DUNKNOWN@ 2020",
+            # dual year only works for GREGORIAN
+            "@#DJULIAN@ 2020/21",
+            # cannot parse nonsense
+            "start of time",
+        ]
+        for datestr in bad_dates:
+            with self.subTest(date=datestr):
+                with self.assertRaises(ValueError):
+                    CalendarDate.parse(datestr)
 
     def test_006_cal_date_visitor(self):
         """Test date.CalendarDate.accept method."""
@@ -432,11 +433,13 @@ class TestDetailDate(unittest.TestCase):
 
         for appr, fmt, klass, typeEnum in approx:
             for datestr, value in dates.items():
-                date = DateValue.parse(appr + " " + datestr)
-                self.assertIsInstance(date, klass)
-                self.assertEqual(date.kind, typeEnum)
-                self.assertEqual(str(date), fmt + " " + datestr)
-                self.assertEqual(date.date, value)
+                # each combination is reported separately on failure
+                with self.subTest(appr=appr, date=datestr):
+                    date = DateValue.parse(appr + " " + datestr)
+                    self.assertIsInstance(date, klass)
+                    self.assertEqual(date.kind, typeEnum)
+                    self.assertEqual(str(date), fmt + " " + datestr)
+                    self.assertEqual(date.date, value)
 
     def test_015_date_parse_phrase(self):
         """Test date.DateValue class."""
@@ -478,53 +481,54 @@ class TestDetailDate(unittest.TestCase):
     def test_017_date_cmp(self):
         """Test date.Date class."""
 
-        dv = DateValue.parse("2016")
-        self.assertIsInstance(dv.key(), tuple)
-        self.assertEqual(dv.key(), (GregorianDate(2016), GregorianDate(2016)))
-
-        dv = DateValue.parse("31 DEC 2000")
-        self.assertIsInstance(dv.key(), tuple)
-        self.assertEqual(dv.key(), (GregorianDate(2000, "DEC", 31), GregorianDate(2000, "DEC", 31)))
-
-        dv = DateValue.parse("BET 31 DEC 2000 AND 1 JAN 2001")
-        self.assertIsInstance(dv.key(), tuple)
-        self.assertEqual(dv.key(), (GregorianDate(2000, "DEC", 31), GregorianDate(2001, "JAN", 1)))
-
-        # order of dates is messed up
-        dv = DateValue.parse("BET 31 DEC 2000 AND 1 JAN 2000")
-        self.assertIsInstance(dv.key(), tuple)
-        self.assertEqual(dv.key(), (GregorianDate(2000, "DEC", 31), GregorianDate(2000, "JAN", 1)))
+        dates = [
+            DateValue.parse("2016"),
+            DateValue.parse("31 DEC 2000"),
+            DateValue.parse("BET 31 DEC 2000 AND 1 JAN 2001"),
+            # order of dates is messed up
+            DateValue.parse("BET 31 DEC 2000 AND 1 JAN 2000"),
+        ]
+        expected = [
+            (GregorianDate(2016), GregorianDate(2016)),
+            (GregorianDate(2000, "DEC", 31), GregorianDate(2000, "DEC", 31)),
+            (GregorianDate(2000, "DEC", 31), GregorianDate(2001, "JAN", 1)),
+            (GregorianDate(2000, "DEC", 31), GregorianDate(2000, "JAN", 1)),
+        ]
+        keys = [dv.key() for dv in dates]
+        for key in keys:
+            self.assertIsInstance(key, tuple)
+        self.assertEqual(keys, expected)
 
-        self.assertTrue(DateValue.parse("2016") < DateValue.parse("2017"))
-        self.assertTrue(DateValue.parse("2 JAN 2016") > DateValue.parse("1 JAN 2016"))
-        self.assertTrue(DateValue.parse("BET 1900 AND 2000") < DateValue.parse("FROM 1920 TO 1999"))
+        self.assertLess(DateValue.parse("2016"), DateValue.parse("2017"))
+        self.assertGreater(DateValue.parse("2 JAN 2016"), DateValue.parse("1 JAN 2016"))
+        self.assertLess(DateValue.parse("BET 1900 AND 2000"), DateValue.parse("FROM 1920 TO 1999"))
 
         # comparing simple date with range
-        self.assertTrue(DateValue.parse("1 JAN 2000") > DateValue.parse("BET 1 JAN 1999 AND 1 JAN 2000"))
+        self.assertGreater(DateValue.parse("1 JAN 2000"), DateValue.parse("BET 1 JAN 1999 AND 1 JAN 2000"))
         self.assertNotEqual(DateValue.parse("1 JAN 2000"), DateValue.parse("BET 1 JAN 2000 AND 1 JAN 2001"))
-        self.assertTrue(DateValue.parse("1 JAN 2000") < DateValue.parse("BET 1 JAN 2000 AND 1 JAN 2001"))
-        self.assertTrue(DateValue.parse("1 JAN 2000") > DateValue.parse("BEF 1 JAN 2000"))
-        self.assertTrue(DateValue.parse("1 JAN 2000") > DateValue.parse("TO 1 JAN 2000"))
-        self.assertTrue(DateValue.parse("1 JAN 2000") < DateValue.parse("AFT 1 JAN 2000"))
-        self.assertTrue(DateValue.parse("1 JAN 2000") < DateValue.parse("FROM 1 JAN 2000"))
+        self.assertLess(DateValue.parse("1 JAN 2000"), DateValue.parse("BET 1 JAN 2000 AND 1 JAN 2001"))
+        self.assertGreater(DateValue.parse("1 JAN 2000"), DateValue.parse("BEF 1 JAN 2000"))
+        self.assertGreater(DateValue.parse("1 JAN 2000"), DateValue.parse("TO 1 JAN 2000"))
+        self.assertLess(DateValue.parse("1 JAN 2000"), DateValue.parse("AFT 1 JAN 2000"))
+        self.assertLess(DateValue.parse("1 JAN 2000"), DateValue.parse("FROM 1 JAN 2000"))
 
         # comparing ranges
         self.assertEqual(DateValue.parse("FROM 1 JAN 2000 TO 1 JAN 2001"),
                          DateValue.parse("BET 1 JAN 2000 AND 1 JAN 2001"))
-        self.assertTrue(DateValue.parse("FROM 1 JAN 1999 TO 1 JAN 2001") <
-                        DateValue.parse("BET 1 JAN 2000 AND 1 JAN 2001"))
-        self.assertTrue(DateValue.parse("FROM 1 JAN 2000 TO 1 JAN 2002") >
+        self.assertLess(DateValue.parse("FROM 1 JAN 1999 TO 1 JAN 2001"),
                         DateValue.parse("BET 1 JAN 2000 AND 1 JAN 2001"))
+        self.assertGreater(DateValue.parse("FROM 1 JAN 2000 TO 1 JAN 2002"),
+                           DateValue.parse("BET 1 JAN 2000 AND 1 JAN 2001"))
 
         # Less specific date compares later than more specific
-        self.assertTrue(DateValue.parse("2000") > DateValue.parse("31 DEC 2000"))
-        self.assertTrue(DateValue.parse("DEC 2000") > DateValue.parse("31 DEC 2000"))
+        self.assertGreater(DateValue.parse("2000"), DateValue.parse("31 DEC 2000"))
+        self.assertGreater(DateValue.parse("DEC 2000"), DateValue.parse("31 DEC 2000"))
 
         # phrase is always later than any regular date
-        self.assertTrue(DateValue.parse("(Could be 1996 or 1998)") > DateValue.parse("2000"))
+        self.assertGreater(DateValue.parse("(Could be 1996 or 1998)"), DateValue.parse("2000"))
 
         # "empty" date is always later than any regular date
-        self.assertTrue(DateValue.parse("") > DateValue.parse("2000"))
+        self.assertGreater(DateValue.parse(""), DateValue.parse("2000"))
 
     def test_018_date_parse_empty(self):
         """Test date.DateValue class."""
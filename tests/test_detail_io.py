@@ -9,7 +9,7 @@ import tempfile
 import os
 import unittest
 
-from ged4py.detail.io import check_bom, guess_lineno, BinaryFileCR
+from ged4py.detail.io import advise_sequential, check_bom, guess_lineno, BinaryFileCR
 
 
 @contextmanager
@@ -171,3 +171,13 @@ class TestDetailIo(unittest.TestCase):
         self.assertEqual(len(line), 0)
         line = file.readline(0)
         self.assertEqual(len(line), 0)
+
+    def test_004_advise_sequential(self):
+        """Test detail.io.advise_sequential()."""
+
+        # it is only a hint, should work with any kind of file
+        advise_sequential(io.BytesIO(b"0 HEAD"))
+        with _temp_file(b"0 HEAD") as fname:
+            with open(fname, "rb") as file:
+                advise_sequential(file)
+                self.assertEqual(file.read(), b"0 HEAD")
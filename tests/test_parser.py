@@ -8,6 +8,7 @@ import io
 import tempfile
 import os
 import unittest
+from unittest.mock import patch
 
 from ged4py import model, parser
 from ged4py.detail.io import BinaryFileCR
@@ -164,6 +165,37 @@ class TestParser(unittest.TestCase):
         with _temp_file(data) as fname:
             self.assertRaises(parser.CodecError, parser.GedcomReader, fname)
 
+    def test_012_open_codec_cache(self):
+        """Test caching of guess_codec() results."""
+
+        data = b"0 HEAD\n1 CHAR ASCII\n0 TRLR"
+        with _temp_file(data) as fname:
+            with patch.object(parser, "guess_codec", wraps=parser.guess_codec) as guess:
+                for i in range(3):
+                    with parser.GedcomReader(fname) as reader:
+                        self.assertEqual(reader._encoding, "ascii")
+                        self.assertEqual(reader._bom_size, 0)
+                self.assertEqual(guess.call_count, 1)
+
+                # different arguments are not cached together
+                with parser.GedcomReader(fname, require_char=True) as reader:
+                    self.assertEqual(reader._encoding, "ascii")
+                self.assertEqual(guess.call_count, 2)
+
+                # modified file is analyzed again
+                with open(fname, "wb") as file:
+                    file.write(b"\xef\xbb\xbf0 HEAD\n1 CHAR UTF-8\n0 TRLR")
+                with parser.GedcomReader(fname) as reader:
+                    self.assertEqual(reader._encoding, "utf-8")
+                    self.assertEqual(reader._bom_size, 3)
+                self.assertEqual(guess.call_count, 3)
+
+                # file objects are not cached
+                for i in range(2):
+                    with parser.GedcomReader(_make_file_object(data)) as reader:
+                        self.assertEqual(reader._encoding, "ascii")
+                self.assertEqual(guess.call_count, 5)
+
     def test_015_init_index(self):
         """Test _init_index() method."""
 
@@ -181,6 +213,31 @@ class TestParser(unittest.TestCase):
                 self.assertEqual(reader._xref0, {"@i1@": (7, "INDI"),
                                                  "@i2@": (19, "INDI"),
                                                  "@i3@": (31, "INDI")})
+                self.assertEqual(reader._tag0, {"HEAD": [0], "INDI": [7, 19, 31], "TRLR": [43]})
+
+        # index has to agree with GedcomLines for any terminators and block
+        # boundaries
+        lines = [b"0 HEAD", b"1 CHAR ASCII", b"0 @i1@ INDI", b"1 NAME A /B/", b"",
+                 b"  0 @i2@ INDI", b"1 BIRT", b"2 DATE 2000", b"00 TRLR"]
+        for term in (b"\n", b"\r\n", b"\r"):
+            data = term.join(lines)
+            for block_size in (1, 2, 5, 1024):
+                with patch.object(parser, "_MAX_BLOCK_SIZE", block_size):
+                    with _make_file_object(data) as file:
+                        with parser.GedcomReader(file) as reader:
+                            reader._init_index()
+                            offsets = [offset for offset, _ in reader._iter_lines(0)]
+                            expect = [(offsets[0], "HEAD"), (offsets[2], "INDI"),
+                                      (offsets[5], "INDI"), (offsets[8], "TRLR")]
+                            self.assertEqual(reader._index0, expect)
+                            self.assertEqual(reader._xref0, {"@i1@": (offsets[2], "INDI"),
+                                                             "@i2@": (offsets[5], "INDI")})
+
+        # syntax errors in level 0 lines
+        data = b"0 HEAD\n0 @i1@ IN@DI\n0 TRLR"
+        with _make_file_object(data) as file:
+            with parser.GedcomReader(file) as reader:
+                self.assertRaises(parser.ParserError, reader._init_index)
 
     def test_017_dialect(self):
         """Test dialect property."""
@@ -215,6 +272,40 @@ class TestParser(unittest.TestCase):
             with parser.GedcomReader(fname) as reader:
                 self.assertEqual(reader.dialect, model.Dialect.DEFAULT)
 
+    def test_018_GedcomLine(self):
+        """Test GedcomLine class"""
+
+        line = parser.GedcomLine(1, "@I1@", "INDI", b"X", 10)
+        self.assertEqual(line, parser.GedcomLine(level=1, xref_id="@I1@", tag="INDI", value=b"X", offset=10))
+        self.assertNotEqual(line, parser.GedcomLine(1, "@I1@", "INDI", b"X", 11))
+        self.assertEqual(line, (1, "@I1@", "INDI", b"X", 10))
+        self.assertEqual(hash(line), hash(parser.GedcomLine(1, "@I1@", "INDI", b"X", 10)))
+        self.assertEqual(len({line, parser.GedcomLine(1, "@I1@", "INDI", b"X", 10)}), 1)
+        self.assertEqual(repr(line),
+                         "GedcomLine(level=1, xref_id='@I1@', tag='INDI', value=b'X', offset=10)")
+        with self.assertRaises(AttributeError):
+            line.other = 1
+        level, xref_id, tag, value, offset = line
+        self.assertEqual((level, xref_id, tag, value, offset), (1, "@I1@", "INDI", b"X", 10))
+        self.assertEqual(line[2], "INDI")
+        self.assertEqual(line._replace(offset=11), parser.GedcomLine(1, "@I1@", "INDI", b"X", 11))
+
+    def test_019_iter_lines(self):
+        """Test _iter_lines method"""
+
+        data = b"0 HEAD\r\n1 CHAR ASCII\r1 SOUR PIF PAF\n\n0 @i1@ INDI\r\n0 TRLR"
+        expect = [(0, b"0 HEAD"), (8, b"1 CHAR ASCII"), (21, b"1 SOUR PIF PAF"),
+                  (36, b""), (37, b"0 @i1@ INDI"), (50, b"0 TRLR")]
+        # small block sizes to exercise lines spanning multiple blocks
+        for block_size in (1, 2, 3, 7, 1024):
+            with patch.object(parser, "_MIN_BLOCK_SIZE", block_size), \
+                    patch.object(parser, "_MAX_BLOCK_SIZE", block_size):
+                with _make_file_object(data) as file:
+                    with parser.GedcomReader(file) as reader:
+                        self.assertEqual(list(reader._iter_lines(0)), expect)
+                        self.assertEqual(list(reader._iter_lines(21)), expect[2:])
+                        self.assertEqual(list(reader._iter_lines(100)), [])
+
     def test_020_GedcomLines(self):
         """Test GedcomLines method"""
 
@@ -323,6 +414,48 @@ class TestParser(unittest.TestCase):
                     itr = reader.GedcomLines(0)
                     self.assertRaises(parser.IntegrityError, list, itr)
 
+    def test_022_GedcomLines_syntax(self):
+        """Test GedcomLines method with less common line syntax"""
+
+        data = b"0 HEAD\n1 _UID 1234\n  1 NOTE\n1  SOUR  X \n1 EMPTY \n0 @I 1@ INDI\n0 TRLR"
+        with _make_file_object(data) as file:
+            with parser.GedcomReader(file) as reader:
+                lines = list(reader.GedcomLines(0))
+                expect = [parser.GedcomLine(level=0, xref_id=None, tag="HEAD", value=None, offset=0),
+                          parser.GedcomLine(level=1, xref_id=None, tag="_UID", value=b"1234", offset=7),
+                          parser.GedcomLine(level=1, xref_id=None, tag="NOTE", value=None, offset=19),
+                          parser.GedcomLine(level=1, xref_id=None, tag="SOUR", value=b" X ", offset=28),
+                          parser.GedcomLine(level=1, xref_id=None, tag="EMPTY", value=b"", offset=40),
+                          parser.GedcomLine(level=0, xref_id="@I 1@", tag="INDI", value=None, offset=49),
+                          parser.GedcomLine(level=0, xref_id=None, tag="TRLR", value=None, offset=62)]
+                self.assertEqual(lines, expect)
+
+    def test_023_GedcomLines_regex(self):
+        """Test that GedcomLines agrees with the line grammar regex"""
+
+        lines = [b"0 HEAD", b"1 NOTE", b"1 NOTE ", b"1 NOTE  two  spaces ",
+                 b"1 NOTE\ttab", b"1\tNOTE tab", b"0 @I1@ INDI", b"0 @I1@ INDI ",
+                 b"0 @I1@ INDI value", b"0 @-1@ INDI", b"1 NOTE @I1@",
+                 b"1 NOTE @@I1@", b"0 @I1@  INDI", b"1 _TAG-1 x", b"1 NOTE \xc2\xb5",
+                 b"01 NOTE x", b"10 NOTE x"]
+        for line in lines:
+            with self.subTest(line=line):
+                data = b"0 HEAD\n1 CHAR UTF-8\n" + b"0 X\n" * 10 + line
+                offset = len(data) - len(line)
+                match = parser._re_GedcomLine.match(line)
+                with _make_file_object(data) as file:
+                    with parser.GedcomReader(file) as reader:
+                        if match is None:
+                            with self.assertRaises(parser.ParserError):
+                                list(reader.GedcomLines(offset))
+                            continue
+                        gline = list(reader.GedcomLines(offset))[0]
+                expect = (int(match.group("level")), match.group("xref"),
+                          match.group("tag"), match.group("value"))
+                xref_id = gline.xref_id.encode() if gline.xref_id else None
+                self.assertEqual((gline.level, xref_id, gline.tag.encode(), gline.value),
+                                 expect)
+
     def test_030_read_record(self):
         """Test read_record method"""
 
@@ -376,6 +509,14 @@ class TestParser(unittest.TestCase):
                 self.assertEqual(subd.value, "D")
                 self.assertEqual(len(subd.sub_records), 0)
 
+                # reading starting at sub-record
+                subb = reader.read_record(38)
+                self.assertEqual(subb.level, 1)
+                self.assertEqual(subb.tag, "SUBB")
+                self.assertEqual(subb.value, "B")
+                self.assertEqual(len(subb.sub_records), 1)
+                self.assertEqual(subb.sub_records[0].tag, "SUBC")
+
         data = b"0 HEAD\n1 CHAR ASCII\n0 INDI A\n1 NOTE A\n2 CONC B\n2 CONT C\n2 CONC D"
         with _temp_file(data) as fname:
             with parser.GedcomReader(fname) as reader:
@@ -476,6 +617,102 @@ class TestParser(unittest.TestCase):
                 self.assertEqual(note.tag, "TAG")
                 self.assertEqual(note.value, "Pål")
 
+        # ASCII-only strings bypass ANSEL codec
+        data = b"0 HEAD\n1 CHAR ANSEL\n"\
+            b"0 @N1@ TAG Pa\n"\
+            b"1 CONC l\n"\
+            b"1 PLAC Pal"
+
+        with _temp_file(data) as fname:
+            with parser.GedcomReader(fname) as reader:
+
+                self.assertTrue(reader._ascii_compatible)
+                note = reader.read_record(20)
+                self.assertEqual(note.xref_id, "@N1@")
+                self.assertEqual(note.value, "Pal")
+                self.assertEqual(note.sub_records[0].value, "Pal")
+
+        self.assertTrue(parser._ascii_compatible("gedcom"))
+        self.assertTrue(parser._ascii_compatible("utf-8"))
+        self.assertFalse(parser._ascii_compatible("utf-16-le"))
+        # stateful codec, escape sequences are ASCII bytes
+        self.assertFalse(parser._ascii_compatible("iso2022_jp"))
+        self.assertFalse(parser._ascii_compatible("iso2022_jp_2"))
+        self.assertFalse(parser._ascii_compatible("not-an-encoding"))
+
+        # text in stateful 7-bit codec is all ASCII bytes
+        note = "日本".encode("iso2022_jp")
+        data = b"0 HEAD\n1 CHAR ISO-2022-JP\n0 @I1@ INDI\n1 NOTE " + note + \
+            b"\n2 CONC " + note
+        with _make_file_object(data) as file:
+            with parser.GedcomReader(file) as reader:
+                self.assertFalse(reader._ascii_compatible)
+                rec = reader.read_record(26)
+                self.assertEqual(rec.sub_records[0].value, "日本日本")
+
+        # codec decode function is only used for non-builtin codecs
+        self.assertIsNone(parser._codec_decode("utf-8"))
+        self.assertIsNone(parser._codec_decode("not-an-encoding"))
+        decode = parser._codec_decode("cp1251")
+        self.assertEqual(decode(b"\xc8\xe2\xe0\xed", "strict"), ("Иван", 4))
+
+        data = b"0 HEAD\n1 CHAR CP1251\n0 TAG \xc8\xe2\xe0\xed"
+        with _make_file_object(data) as file:
+            with parser.GedcomReader(file) as reader:
+                self.assertEqual(reader.read_record(21).value, "Иван")
+
+    def test_032_read_record_cache(self):
+        """Test caching of records in read_record method"""
+
+        data = b"0 HEAD\n1 CHAR ASCII\n0 INDI A\n1 NAME A\n0 INDI B\n0 TRLR"
+        with _make_file_object(data) as file:
+            with parser.GedcomReader(file, record_cache_size=2) as reader:
+                rec_a = reader.read_record(20)
+                self.assertEqual(rec_a.value, "A")
+                self.assertIs(reader.read_record(20), rec_a)
+                # header was read too to determine dialect
+                self.assertEqual(list(reader._record_cache), [0, 20])
+
+                # records are evicted in least recently used order
+                rec_b = reader.read_record(38)
+                self.assertEqual(rec_b.value, "B")
+                self.assertIs(reader.read_record(20), rec_a)
+                reader.read_record(47)
+                self.assertEqual(list(reader._record_cache), [20, 47])
+                self.assertIsNot(reader.read_record(38), rec_b)
+            # cache is released when reader is closed
+            self.assertEqual(len(reader._record_cache), 0)
+
+        # changing dialect drops records read with previous dialect
+        with _make_file_object(data) as file:
+            with parser.GedcomReader(file) as reader:
+                rec_a = reader.read_record(20)
+                self.assertEqual(rec_a.dialect, model.Dialect.DEFAULT)
+                reader.dialect = model.Dialect.ALTREE
+                rec = reader.read_record(20)
+                self.assertIsNot(rec, rec_a)
+                self.assertEqual(rec.dialect, model.Dialect.ALTREE)
+                self.assertEqual([rec.dialect for rec in reader.records0("INDI")],
+                                 [model.Dialect.ALTREE] * 2)
+
+        with _make_file_object(data) as file:
+            with parser.GedcomReader(file, record_cache_size=0) as reader:
+                rec_a = reader.read_record(20)
+                self.assertIsNot(reader.read_record(20), rec_a)
+                self.assertEqual(len(reader._record_cache), 0)
+
+    def test_033_read_record_long_note(self):
+        """Test read_record method with many CONT/CONC lines"""
+
+        data = b"0 HEAD\n1 CHAR ASCII\n0 NOTE start\n" + \
+            b"1 CONT line\n1 CONC  more\n" * 1000 + b"0 TRLR"
+        with _make_file_object(data) as file:
+            with parser.GedcomReader(file) as reader:
+                note = reader.read_record(20)
+                self.assertEqual(note.tag, "NOTE")
+                self.assertEqual(note.value, "start" + "\nline more" * 1000)
+                self.assertEqual(note.sub_records, [])
+
     def test_035_read_record_errors(self):
         """Test read_record method"""
 
@@ -521,6 +758,63 @@ class TestParser(unittest.TestCase):
                 self.assertEqual(len(rec.sub_records), 0)
                 self.assertEqual(rec.dialect, model.Dialect.DEFAULT)
 
+                # all records are read sequentially without index
+                self.assertIsNone(reader._index0)
+                self.assertEqual([rec.offset for rec in reader.records0()],
+                                 [offset for offset, _ in reader.index0])
+
+                recs = list(reader.records0("INDI"))
+                self.assertEqual(len(recs), 1)
+                self.assertEqual(recs[0].tag, "INDI")
+                self.assertEqual(recs[0].value, "A")
+
+                recs = list(reader.records0("FAM"))
+                self.assertEqual(len(recs), 0)
+
+        data = b"0 HEAD\n0 @I1@ INDI A\n0 @F1@ FAM\n0 @I2@ INDI B\n0 TRLR"
+        with _make_file_object(data) as file:
+            with parser.GedcomReader(file) as reader:
+
+                # records with a tag are found without index, index is
+                # only set when whole file is scanned
+                records = reader.records0("INDI")
+                rec = next(records)
+                self.assertEqual(rec.value, "A")
+                records.close()
+                self.assertIsNone(reader._tag0)
+
+                self.assertEqual([rec.value for rec in reader.records0("INDI")], ["A", "B"])
+                self.assertEqual(reader._tag0, {"HEAD": [0], "INDI": [7, 32], "FAM": [21], "TRLR": [46]})
+                self.assertEqual(reader.xref0, {"@I1@": (7, "INDI"), "@F1@": (21, "FAM"),
+                                                "@I2@": (32, "INDI")})
+                self.assertEqual([rec.value for rec in reader.records0("INDI")], ["A", "B"])
+
+        # resolving pointers while iterating builds index, scan for records
+        # has to switch to index instead of reading rest of file again
+        data = b"0 HEAD\n0 @I1@ INDI\n1 FAMC @F1@\n0 @I2@ INDI\n0 @F1@ FAM\n1 HUSB @I2@\n0 TRLR"
+        with _make_file_object(data) as file:
+            with parser.GedcomReader(file) as reader:
+
+                iter_level0_lines = reader._iter_level0_lines
+                lines = []
+
+                def counting_iter(offset):
+                    for item in iter_level0_lines(offset):
+                        lines.append(item[0])
+                        yield item
+
+                with patch.object(reader, "_iter_level0_lines", counting_iter):
+                    fathers = {}
+                    for indi in reader.records0("INDI"):
+                        father = indi.father
+                        fathers[indi.xref_id] = father.xref_id if father else None
+
+                self.assertEqual(fathers, {"@I1@": "@I2@", "@I2@": None})
+                # HEAD and @I1@ by records0(), then all five lines by index
+                self.assertEqual(len(lines), 7)
+                self.assertEqual(lines[:2], [0, 7])
+                self.assertEqual(sorted(set(lines)), [0, 7, 31, 43, 66])
+
     def test_041_header(self):
         """Test header property."""
 
@@ -528,6 +822,8 @@ class TestParser(unittest.TestCase):
         with _temp_file(data) as fname:
             with parser.GedcomReader(fname) as reader:
                 rec = reader.header
+                # header does not need full index
+                self.assertIsNone(reader._index0)
                 self.assertEqual(rec.level, 0)
                 self.assertEqual(rec.tag, "HEAD")
                 self.assertEqual(rec.value, None)
@@ -551,6 +847,10 @@ class TestParser(unittest.TestCase):
                 self.assertEqual(rec.value, None)
                 self.assertEqual(len(rec.sub_records), 2)
                 self.assertEqual(rec.dialect, model.Dialect.DEFAULT)
+                for sub in rec.sub_records:
+                    self.assertEqual(sub.dialect, model.Dialect.DEFAULT)
+                for sub in recs[1].sub_records:
+                    self.assertEqual(sub.dialect, model.Dialect.ALTREE)
 
                 rec = recs[1]
                 self.assertEqual(rec.level, 0)
@@ -565,3 +865,12 @@ class TestParser(unittest.TestCase):
                 self.assertEqual(rec.value, None)
                 self.assertEqual(len(rec.sub_records), 0)
                 self.assertEqual(rec.dialect, model.Dialect.ALTREE)
+
+        # dialect is known when reading records without index
+        data = b"0 HEAD\n1 SOUR ALTREE\n0 INDI A\n0 TRLR"
+        with _make_file_object(data) as file:
+            with parser.GedcomReader(file) as reader:
+                rec = reader.read_record(21)
+                self.assertEqual(rec.tag, "INDI")
+                self.assertEqual(rec.dialect, model.Dialect.ALTREE)
+                self.assertIsNone(reader._index0)